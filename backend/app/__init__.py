@@ -1,5 +0,0 @@
-# SPDX-FileCopyrightText: 2020
-# - Kotyba Alhaj Taha <kotyba.alhaj-taha@ufz.de>
-# - Helmholtz Centre for Environmental Research GmbH - UFZ (UFZ, https://www.ufz.de)
-#
-# SPDX-License-Identifier: EUPL-1.2
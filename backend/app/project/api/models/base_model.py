@@ -7,3 +7,13 @@
 from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
+
+
+def string_array():
+    """
+    Return the type for a list of strings.
+
+    Those are arrays in postgres. For sqlite (that we can use for
+    running tests in memory) we fall back to json.
+    """
+    return db.ARRAY(db.String).with_variant(db.JSON, "sqlite")
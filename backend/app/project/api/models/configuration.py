@@ -14,7 +14,7 @@ from sqlalchemy.ext.mutable import MutableList
 
 from ..es_utils import ElasticSearchIndexTypes, settings_with_ngrams
 from ..helpers.errors import ConflictError
-from .base_model import db
+from .base_model import db, string_array
 from .mixin import (
     ArchivableMixin,
     AuditMixin,
@@ -44,7 +44,7 @@ class Configuration(
     persistent_identifier = db.Column(db.String(256), nullable=True, unique=True)
     site_id = db.Column(db.Integer, db.ForeignKey("site.id"), nullable=True)
     site = db.relationship("Site", backref="configurations")
-    keywords = db.Column(MutableList.as_mutable(db.ARRAY(db.String)), nullable=True)
+    keywords = db.Column(MutableList.as_mutable(string_array()), nullable=True)
 
     def validate(self):
         """
@@ -20,7 +20,7 @@ from ..models.mixin import (
     PermissionMixin,
     SearchableMixin,
 )
-from .base_model import db
+from .base_model import db, string_array
 
 
 class Device(
@@ -50,7 +50,7 @@ class Device(
     status_uri = db.Column(db.String(256), nullable=True)
     status_name = db.Column(db.String(256), nullable=True)
     update_description = db.Column(db.String(256), nullable=True)
-    keywords = db.Column(MutableList.as_mutable(db.ARRAY(db.String)), nullable=True)
+    keywords = db.Column(MutableList.as_mutable(string_array()), nullable=True)
     country = db.Column(db.String(256), nullable=True)
 
     def to_search_entry(self, include_relationships=True):
@@ -26,7 +26,7 @@ from ..search import (
     remove_from_index,
     remove_index,
 )
-from .base_model import db
+from .base_model import db, string_array
 
 
 def utc_now():
@@ -485,7 +485,7 @@ class PermissionMixin(BeforeCommitValidatableMixin):
     """
 
     __abstract__ = True
-    group_ids = db.Column(MutableList.as_mutable(db.ARRAY(db.String)), nullable=True)
+    group_ids = db.Column(MutableList.as_mutable(string_array()), nullable=True)
     is_private = db.Column(db.Boolean, default=False)
     is_internal = db.Column(db.Boolean, default=False)
     is_public = db.Column(db.Boolean, default=False)
@@ -20,7 +20,7 @@ from ..models.mixin import (
     PermissionMixin,
     SearchableMixin,
 )
-from .base_model import db
+from .base_model import db, string_array
 
 
 class Platform(
@@ -50,7 +50,7 @@ class Platform(
     b2inst_record_id = db.Column(db.String(256), nullable=True)
     persistent_identifier = db.Column(db.String(256), nullable=True, unique=True)
     update_description = db.Column(db.String(256), nullable=True)
-    keywords = db.Column(MutableList.as_mutable(db.ARRAY(db.String)), nullable=True)
+    keywords = db.Column(MutableList.as_mutable(string_array()), nullable=True)
     country = db.Column(db.String(256), nullable=True)
 
     def to_search_entry(self, include_relationships=True):
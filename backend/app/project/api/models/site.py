@@ -17,7 +17,7 @@ from ..models.mixin import (
     BeforeCommitValidatableMixin,
     SearchableMixin,
 )
-from .base_model import db
+from .base_model import db, string_array
 
 
 class Site(
@@ -33,7 +33,7 @@ class Site(
     epsg_code = db.Column(db.String(256), default="4326")
     is_internal = db.Column(db.Boolean, default=False)
     is_public = db.Column(db.Boolean, default=False)
-    group_ids = db.Column(MutableList.as_mutable(db.ARRAY(db.String)), nullable=True)
+    group_ids = db.Column(MutableList.as_mutable(string_array()), nullable=True)
     # And for the address
     street = db.Column(db.String(256), nullable=True)
     street_number = db.Column(db.String(256), nullable=True)
@@ -51,7 +51,7 @@ class Site(
     site_usage_uri = db.Column(db.String(256), nullable=True)
     site_usage_name = db.Column(db.String(256), nullable=True)
     website = db.Column(db.String(1024), nullable=True)
-    keywords = db.Column(MutableList.as_mutable(db.ARRAY(db.String)), nullable=True)
+    keywords = db.Column(MutableList.as_mutable(string_array()), nullable=True)
     outer_site_id = db.Column(db.Integer, db.ForeignKey("site.id"), nullable=True)
     outer_site = db.relationship("Site", remote_side=[id])
 
@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 
 """Mixin class for the resources that allows to send informations out via mqtt."""
-import json
+import orjson
 
 from project.extensions.instances import mqtt
 
@@ -33,14 +33,20 @@ class MqttNotificationMixin:
         """Run the post request and send the result to mqtt."""
         result = super().post(*args, **kwargs)
 
+        # We send only the first data entry out.
+        # Part of the issue here is that the post endpoint belongs
+        # to a list resource.
+        # Those uses the schema with many=True - to use them
+        # to serialize a list of entities.
+        # However, after the post we only return one single instance.
+        payload = result[0]
+        # And we only need to serialize it once for all the topics.
+        serialized_payload = orjson.dumps(payload)
+        # flask_rest_jsonapi adds the jsonapi version to the result
+        # later, so we keep a copy of the data that we really send.
+        payload_dict = dict(payload)
         for topic in self._notification_post_topics():
-            # We send only the first data entry out.
-            # Part of the issue here is that the post endpoint belongs
-            # to a list resource.
-            # Those uses the schema with many=True - to use them
-            # to serialize a list of entities.
-            # However, after the post we only return one single instance.
-            mqtt.publish(topic, json.dumps(result[0]), 2)
+            mqtt.publish(topic, serialized_payload, 2, payload_dict=payload_dict)
 
         return result
 
@@ -48,8 +54,11 @@ class MqttNotificationMixin:
         """Run the patch request and send the result to mqtt."""
         result = super().patch(*args, **kwargs)
 
+        serialized_payload = orjson.dumps(result)
+        # See the post method about the copy.
+        payload_dict = dict(result)
         for topic in self._notification_patch_topics():
-            mqtt.publish(topic, json.dumps(result), 2)
+            mqtt.publish(topic, serialized_payload, 2, payload_dict=payload_dict)
 
         return result
 
@@ -59,18 +68,14 @@ class MqttNotificationMixin:
         id_ = kwargs["id"]
 
         type_ = self.schema.Meta.type_
+        payload = {
+            # We create a similar payload here, as we have
+            # for the others.
+            "data": {"type": type_, "id": str(id_)}
+        }
+        serialized_payload = orjson.dumps(payload)
         for topic in self._notification_delete_topics():
-            mqtt.publish(
-                topic,
-                json.dumps(
-                    {
-                        # We create a similar payload here, as we have
-                        # for the others.
-                        "data": {"type": type_, "id": str(id_)}
-                    }
-                ),
-                2,
-            )
+            mqtt.publish(topic, serialized_payload, 2, payload_dict=payload)
 
         return result
 
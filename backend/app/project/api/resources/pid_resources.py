@@ -10,8 +10,8 @@
 
 """PID resources."""
 import datetime
-import json
 
+import orjson
 from flask import g, request
 from flask_rest_jsonapi import ResourceDetail, ResourceList
 
@@ -90,7 +90,7 @@ class PidList(ResourceList):
         }
         topic, schema = topic_and_schema_by_type.get(type(instrument), (None, None))
         if topic and schema:
-            mqtt.publish(topic, json.dumps(schema().dump(instrument)))
+            mqtt.publish(topic, orjson.dumps(schema().dump(instrument)))
 
         response = {"pid": persistent_identifier}
         return response
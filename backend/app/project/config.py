@@ -13,11 +13,29 @@
 """Config for the app."""
 
 from environs import Env
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool, StaticPool
 
 env = Env()
 env.read_env()
 
 
+def database_url_for_test_worker(database_url):
+    """
+    Return the database url for the current pytest-xdist worker.
+
+    When we run the tests in parallel, every worker needs its own
+    database. Without a worker (or without an url) we keep the url
+    as it is.
+    """
+    worker = env("PYTEST_XDIST_WORKER", None)
+    if not database_url or not worker:
+        return database_url
+    url = make_url(database_url)
+    url = url.set(database=f"{url.database}_{worker}")
+    return url.render_as_string(hide_password=False)
+
+
 class BaseConfig:
     """Base configuration."""
 
@@ -110,13 +128,36 @@ class TestingConfig(BaseConfig):
     """Testing configuration."""
 
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = env("DATABASE_TEST_URL", None)
     ELASTICSEARCH_URL = None
     # https://github.com/jarus/flask-testing/issues/21
     # AssertionError: Popped wrong request context
     PRESERVE_CONTEXT_ON_EXCEPTION = False
     INSTITUTE = None
-    SQLALCHEMY_ENGINE_OPTIONS = {"connect_args": {"options": "-c timezone=utc"}}
+    # With TESTING_FAST we run the tests against an in memory sqlite db.
+    # This is much faster for running single test files locally, but
+    # it doesn't support the postgres specific features (like postgis).
+    TESTING_FAST = env.bool("TESTING_FAST", False)
+    if TESTING_FAST:
+        SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+        # There is only one connection for the in memory database.
+        SQLALCHEMY_POOL_TIMEOUT = None
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+    else:
+        SQLALCHEMY_DATABASE_URI = database_url_for_test_worker(
+            env("DATABASE_TEST_URL", None)
+        )
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            "connect_args": {"options": "-c timezone=utc"},
+            # Keep the connections open over all the tests, so that we
+            # don't need to connect to the database again for every test.
+            "poolclass": QueuePool,
+            "pool_size": 5,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+        }
 
 
 class ProductionConfig(BaseConfig):
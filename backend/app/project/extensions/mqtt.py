@@ -35,11 +35,15 @@ class LazyMqttInitWrapper:
         if not self.mqtt.connected:
             self.mqtt.init_app(current_app)
 
-    def publish(self, *args, **kwargs):
+    def publish(self, *args, payload_dict=None, **kwargs):
         """
         Publish an event on mqtt.
 
         Runs the initialization if needed.
+
+        The payload_dict can contain the data of the payload before
+        it was serialized. It is not sent, but allows to inspect the
+        message without parsing the payload again (in the tests).
         """
         if self._mqtt_config(current_app):
             self._enforce_initialization(current_app)
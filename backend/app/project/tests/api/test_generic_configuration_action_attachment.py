@@ -9,11 +9,12 @@
 """Test cases for the api usage for generic configuration action attachments."""
 
 import json
+import re
 
 from project import base_url, db
-from project.api.models import ConfigurationAttachment
+from project.api.models import ConfigurationAttachment, GenericConfigurationAction
 from project.extensions.instances import mqtt
-from project.tests.base import BaseTestCase, create_token, fake
+from project.tests.base import TransactionalTestCase, create_token, fake
 from project.tests.models.test_generic_action_attachment_model import (
     add_generic_configuration_action_model,
 )
@@ -21,36 +22,60 @@ from project.tests.models.test_generic_actions_models import (
     generate_configuration_action_model,
 )
 
+# The urls are just dummy values for the attachments, so we can
+# create them once.
+IMAGE_URLS = [fake.image_url() for _ in range(3)]
+ID_PATTERN = re.compile(r"\d+")
 
-class TestGenericConfigurationActionAttachment(BaseTestCase):
+
+class TestGenericConfigurationActionAttachment(TransactionalTestCase):
     """Tests for the GenericConfigurationActionAttachment endpoints."""
 
     url = base_url + "/generic-configuration-action-attachments"
     object_type = "generic_configuration_action_attachment"
 
+    @classmethod
+    def set_up_class_data(cls):
+        """Create the generic configuration action with its attachment once."""
+        generic_configuration_action = add_generic_configuration_action_model()
+        cls.generic_configuration_action_id = generic_configuration_action.id
+
+    def setUp(self):
+        """Load the generic configuration action for the test."""
+        super().setUp()
+        self.generic_configuration_action = db.session.get(
+            GenericConfigurationAction, self.generic_configuration_action_id
+        )
+
     def test_get_generic_configuration_action_attachment(self):
-        """Ensure the GET /generic_configuration_action_attachments route reachable."""
+        """
+        Ensure the GET /generic_configuration_action_attachments route reachable.
+
+        The attachment of the class data belongs to an internal configuration,
+        so it is not listed for anonymous users.
+        """
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        # no data yet
+        # no public data yet
         self.assertEqual(response.json["data"], [])
 
     def test_get_generic_configuration_action_attachment_collection(self):
         """Test retrieve a collection of GenericConfigurationActionAttachment objects."""
-        generic_configuration_action = add_generic_configuration_action_model()
+        generic_configuration_action = self.generic_configuration_action
         configuration = generic_configuration_action.configuration
         configuration.is_public = True
         configuration.is_internal = True
-        db.session.add(configuration)
-        db.session.commit()
+        # The configuration is already in the session.
+        db.session.flush()
 
         with self.client:
             response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
         # should be only one
-        self.assertEqual(response.json["meta"]["count"], 1)
+        self.assertEqual(payload["meta"]["count"], 1)
         self.assertEqual(
-            response.json["data"][0]["id"],
+            payload["data"][0]["id"],
             str(
                 generic_configuration_action.generic_configuration_action_attachments[
                     0
@@ -60,25 +85,25 @@ class TestGenericConfigurationActionAttachment(BaseTestCase):
 
     def test_get_generic_configuration_action_attachment_collection_internal(self):
         """Ensure we don't give infos out for internal configurations without having a user."""
-        generic_configuration_action = add_generic_configuration_action_model()
+        generic_configuration_action = self.generic_configuration_action
         configuration = generic_configuration_action.configuration
         self.assertTrue(configuration.is_internal)
 
         with self.client:
             response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json["meta"]["count"], 0)
+        payload = response.get_json()
+        self.assertEqual(payload["meta"]["count"], 0)
 
     def test_post_generic_configuration_action_attachment(self):
         """Create GenericConfigurationActionAttachment."""
         generic_configuration_action = generate_configuration_action_model()
         a1 = ConfigurationAttachment(
             label="configuration attachment1",
-            url=fake.image_url(),
+            url=IMAGE_URLS[0],
             configuration_id=generic_configuration_action.configuration_id,
         )
-        db.session.add(a1)
-        db.session.commit()
+        self.persist(a1)
         data = {
             "data": {
                 "type": self.object_type,
@@ -103,30 +128,33 @@ class TestGenericConfigurationActionAttachment(BaseTestCase):
         )
         # And ensure that we trigger the mqtt.
         mqtt.publish.assert_called_once()
-        call_args = mqtt.publish.call_args[0]
+        call_args = mqtt.publish.call_args
 
-        self.expect(call_args[0]).to_equal(
+        self.expect(call_args.args[0]).to_equal(
             "sms/post-generic-configuration-action-attachment"
         )
-        notification_data = json.loads(call_args[1])["data"]
+        # The payload that we send must match the data that we inspect.
+        self.expect(json.loads(call_args.args[1])).to_equal(
+            call_args.kwargs["payload_dict"]
+        )
+        notification_data = call_args.kwargs["payload_dict"]["data"]
         self.expect(notification_data["type"]).to_equal(
             "generic_configuration_action_attachment"
         )
         self.expect(
             notification_data["relationships"]["action"]["data"]["id"]
         ).to_equal(str(generic_configuration_action.id))
-        self.expect(str).of(notification_data["id"]).to_match(r"\d+")
+        self.expect(str).of(notification_data["id"]).to_match(ID_PATTERN)
 
     def test_update_generic_configuration_action_attachment(self):
         """Update GenericConfigurationActionAttachment."""
-        generic_configuration_action = add_generic_configuration_action_model()
+        generic_configuration_action = self.generic_configuration_action
         attachment = ConfigurationAttachment(
             label="configuration attachment1",
-            url=fake.image_url(),
+            url=IMAGE_URLS[1],
             configuration_id=generic_configuration_action.configuration_id,
         )
-        db.session.add(attachment)
-        db.session.commit()
+        self.persist(attachment)
         action_attachment = (
             generic_configuration_action.generic_configuration_action_attachments[0]
         )
@@ -152,12 +180,16 @@ class TestGenericConfigurationActionAttachment(BaseTestCase):
         )
         # And ensure that we trigger the mqtt.
         mqtt.publish.assert_called_once()
-        call_args = mqtt.publish.call_args[0]
+        call_args = mqtt.publish.call_args
 
-        self.expect(call_args[0]).to_equal(
+        self.expect(call_args.args[0]).to_equal(
             "sms/patch-generic-configuration-action-attachment"
         )
-        notification_data = json.loads(call_args[1])["data"]
+        # The payload that we send must match the data that we inspect.
+        self.expect(json.loads(call_args.args[1])).to_equal(
+            call_args.kwargs["payload_dict"]
+        )
+        notification_data = call_args.kwargs["payload_dict"]["data"]
         self.expect(notification_data["type"]).to_equal(
             "generic_configuration_action_attachment"
         )
@@ -170,7 +202,7 @@ class TestGenericConfigurationActionAttachment(BaseTestCase):
 
     def test_delete_generic_configuration_action_attachment(self):
         """Delete GenericConfigurationActionAttachment."""
-        generic_configuration_action = add_generic_configuration_action_model()
+        generic_configuration_action = self.generic_configuration_action
         action_attachment = (
             generic_configuration_action.generic_configuration_action_attachments[0]
         )
@@ -178,12 +210,16 @@ class TestGenericConfigurationActionAttachment(BaseTestCase):
             url=f"{self.url}/{action_attachment.id}",
         )
         mqtt.publish.assert_called_once()
-        call_args = mqtt.publish.call_args[0]
+        call_args = mqtt.publish.call_args
 
-        self.expect(call_args[0]).to_equal(
+        self.expect(call_args.args[0]).to_equal(
             "sms/delete-generic-configuration-action-attachment"
         )
-        self.expect(json.loads).of(call_args[1]).to_equal(
+        # The payload that we send must match the data that we inspect.
+        self.expect(json.loads(call_args.args[1])).to_equal(
+            call_args.kwargs["payload_dict"]
+        )
+        self.expect(call_args.kwargs["payload_dict"]).to_equal(
             {
                 "data": {
                     "type": "generic_configuration_action_attachment",
@@ -197,11 +233,10 @@ class TestGenericConfigurationActionAttachment(BaseTestCase):
         configuration_action = generate_configuration_action_model()
         a1 = ConfigurationAttachment(
             label="configuration attachment1",
-            url=fake.image_url(),
+            url=IMAGE_URLS[2],
             configuration_id=configuration_action.configuration_id,
         )
-        db.session.add(a1)
-        db.session.commit()
+        self.persist(a1)
         data = {
             "data": {
                 "type": self.object_type,
@@ -45,6 +45,7 @@ class TestSensorMLDevice(BaseTestCase):
     @classmethod
     def setUpClass(cls):
         """Set up data that we can reuse between all the test cases."""
+        super().setUpClass()
         path_this_file = pathlib.Path(__file__)
         path_pickle_schema = (
             path_this_file.parent / "helpers" / "sensorml_schema_validator.pickle"
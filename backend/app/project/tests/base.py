@@ -13,6 +13,7 @@ import functools
 import json
 import os
 import re
+import sqlite3
 import time
 from contextlib import contextmanager
 from unittest.mock import patch
@@ -23,12 +24,16 @@ from flask import request
 from flask_jwt_extended import JWTManager
 from flask_jwt_extended.exceptions import WrongTokenError
 from flask_testing import TestCase
+from geoalchemy2 import Geometry
 from jwt.exceptions import DecodeError
-from sqlalchemy import text
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy_utils import create_database, database_exists, drop_database
 
 from project import create_app
 from project.api.helpers.errors import UnauthorizedError
 from project.api.models.base_model import db
+from project.config import TestingConfig
 from project.extensions.auth.mechanisms.mixins import CreateNewUserByUserinfoMixin
 from project.extensions.instances import auth
 
@@ -39,6 +44,30 @@ fake = Faker()
 test_file_path = os.path.abspath(os.path.dirname(__file__))
 
 
+def ensure_test_database_exists(database_url, template_url=None):
+    """
+    Create the database for the tests if it is not there yet.
+
+    This is needed for running the tests with pytest-xdist, as every
+    worker uses its own database (see conftest.pytest_configure).
+
+    In case there is a template url (the controller of pytest-xdist
+    prepared the schema in the main test database already), we clone
+    it for the worker database - so that the workers don't need to
+    build the schema on their own.
+
+    Returns True if the database has a fresh schema.
+    """
+    if template_url and database_url != template_url:
+        if database_exists(database_url):
+            drop_database(database_url)
+        create_database(database_url, template=make_url(template_url).database)
+        return True
+    if not database_exists(database_url):
+        create_database(database_url)
+    return False
+
+
 def query_result_to_list(query_result):
     """
     Convert a query result to a list.
@@ -324,7 +353,12 @@ class Expectation:
         return self
 
     def to_match(self, pattern, flags=0):
-        """Raise an assertion if the value doesn't match the pattern."""
+        """
+        Raise an assertion if the value doesn't match the pattern.
+
+        The pattern can be a string or an already compiled pattern
+        (flags can't be used for compiled patterns).
+        """
         self.test_case.assertTrue(
             re.match(pattern=pattern, string=self.value, flags=flags)
         )
@@ -392,6 +426,10 @@ class ExpectMixin:
 class BaseTestCase(TestCase, ExpectMixin):
     """Base test case for all testing the code of our app."""
 
+    # Marker if there is a schema that is still usable for the
+    # TransactionalTestCase (so that it doesn't need to recreate it).
+    _schema_is_ready = False
+
     def create_app(self):
         """
         Create the flask app - with test settings.
@@ -436,6 +474,20 @@ class BaseTestCase(TestCase, ExpectMixin):
         finally:
             self._base_test_current_user = previous_user
 
+    @classmethod
+    def setUpClass(cls):
+        """Mock the mqtt.publish method for all the tests of the class."""
+        super().setUpClass()
+        # We need to mock the mqtt.publish method, in order not to
+        # publish to a real queue within our tests.
+        cls.patch_for_mqtt_publish = patch(
+            "project.extensions.mqtt.LazyMqttInitWrapper.publish"
+        )
+        cls.mqtt_publish_mock = cls.patch_for_mqtt_publish.start()
+        # Class cleanups run even if the setUpClass of a subclass fails
+        # (in contrast to tearDownClass).
+        cls.addClassCleanup(cls.patch_for_mqtt_publish.stop)
+
     def setUp(self):
         """
         Set up for all the tests.
@@ -443,23 +495,13 @@ class BaseTestCase(TestCase, ExpectMixin):
         Clear the database & mock the authentification for all of our tests.
         :return: None
         """
-        db.drop_all()
-        # To make sure we have postgis ready.
-        db.session.connection().execute(text("create extension if not exists postgis"))
-        db.session.commit()
-        db.create_all()
-        db.session.commit()
+        self.set_up_database()
 
         # We start every test without being logged in
         self.logout()
-        # And we need to mock the mqtt.publish method, in order not to
-        # publish to a real queue within our tests.
-        # By mocking it per test case, we can easier test that we
+        # By resetting the mock per test case, we can easier test that we
         # wrote our information out (in this small scope).
-        self.patch_for_mqtt_publish = patch(
-            "project.extensions.mqtt.LazyMqttInitWrapper.publish"
-        )
-        self.patch_for_mqtt_publish.start()
+        self.mqtt_publish_mock.reset_mock()
 
     def tearDown(self):
         """
@@ -469,12 +511,54 @@ class BaseTestCase(TestCase, ExpectMixin):
         authentication mechanism.
         :return:
         """
+        self.tear_down_database()
+
+        self.logout()
+
+    @staticmethod
+    def recreate_schema():
+        """Drop & create all the tables in the database."""
+        db.drop_all()
+        if db.engine.dialect.name == "postgresql":
+            # To make sure we have postgis ready.
+            db.session.connection().execute(
+                text("create extension if not exists postgis")
+            )
+            db.session.commit()
+            db.create_all()
+        else:
+            # Without postgis we can't create the tables with geometries.
+            db.metadata.create_all(
+                bind=db.engine,
+                tables=[
+                    table
+                    for table in db.metadata.sorted_tables
+                    if not any(isinstance(c.type, Geometry) for c in table.columns)
+                ],
+            )
+        db.session.commit()
+
+    def set_up_database(self):
+        """Start every test with a fresh schema."""
+        # We drop the schema at the end of the test, so other
+        # test cases can't reuse it.
+        BaseTestCase._schema_is_ready = False
+        self.recreate_schema()
+
+    def tear_down_database(self):
+        """Drop all the content of the database."""
         db.session.remove()
         db.drop_all()
 
-        self.logout()
-        # To reduce the scope of the mqtt.publish mock.
-        self.patch_for_mqtt_publish.stop()
+    def persist(self, *objects):
+        """
+        Add the objects to the session & write them to the database.
+
+        We only flush here, so that we don't need an extra commit
+        for the test data.
+        """
+        db.session.add_all(objects)
+        db.session.flush()
 
     def add_object(self, url, data_object, object_type):
         """Ensure a new object can be added to the database."""
@@ -486,7 +570,7 @@ class BaseTestCase(TestCase, ExpectMixin):
                 content_type="application/vnd.api+json",
                 headers=access_headers,
             )
-        data = json.loads(response.data.decode())
+        data = response.get_json()
         self.assertEqual(response.status_code, 201)
         self.assertIn(object_type, data["data"]["type"])
         return data
@@ -514,7 +598,7 @@ class BaseTestCase(TestCase, ExpectMixin):
                 content_type="application/vnd.api+json",
                 headers=access_headers,
             )
-        data = json.loads(response.data.decode())
+        data = response.get_json()
         self.assertEqual(response.status_code, 422)
         self.assertIn("Not a valid string.", data["errors"][0]["detail"])
 
@@ -528,7 +612,7 @@ class BaseTestCase(TestCase, ExpectMixin):
                 content_type="application/vnd.api+json",
                 headers=access_headers,
             )
-        data = json.loads(response.data.decode())
+        data = response.get_json()
         self.assertEqual(response.status_code, 200)
         self.assertIn(object_type, data["data"]["type"])
         return data
@@ -555,7 +639,7 @@ class BaseTestCase(TestCase, ExpectMixin):
             response = self.client.delete(
                 url, content_type="application/vnd.api+json", headers=access_headers
             )
-        data = json.loads(response.data.decode())
+        data = response.get_json()
         self.assertEqual(response.status_code, 200)
         self.assertIn("Object successfully deleted", data["meta"]["message"])
         return data
@@ -571,3 +655,130 @@ class BaseTestCase(TestCase, ExpectMixin):
         """Ensure that the backend respond with 404 if resource not found."""
         response = self.client.get(url)
         self.assertEqual(response.status_code, 404)
+
+
+def _sqlite_connect(dbapi_connection, connection_record):
+    """Disable the transaction handling of pysqlite."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.isolation_level = None
+
+
+def _sqlite_begin(connection):
+    """Emit our own BEGIN."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN")
+
+
+if TestingConfig.TESTING_FAST:
+    # The pysqlite driver handles the transactions on its own & breaks
+    # the SAVEPOINTs. So we disable it & start the transactions ourselves.
+    # See the sqlalchemy docs about "Serializable isolation / Savepoints /
+    # Transactional DDL" for sqlite.
+    # The in memory database has only one connection (StaticPool), so we
+    # must register the listeners before it is opened. Listening on the
+    # Engine class covers the engine that flask-sqlalchemy creates lazily
+    # (but also every other engine - so we check for sqlite in the
+    # listeners).
+    event.listen(Engine, "connect", _sqlite_connect)
+    event.listen(Engine, "begin", _sqlite_begin)
+
+
+class TransactionalTestCase(BaseTestCase):
+    """
+    Base test case that rolls back the changes of every test.
+
+    Instead of dropping & recreating the schema for every test, we create
+    it once & bind the session to an external connection with an open
+    transaction. Commits (in the tests & in the request handlers) only
+    release a SAVEPOINT that we restart right afterwards - so that we can
+    roll back everything at the end of the test.
+
+    Data that is the same for all the tests of a class can be created
+    in set_up_class_data. It stays in the outer transaction until the
+    end of the test class.
+
+    See the sqlalchemy docs about "Joining a Session into an External
+    Transaction".
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Bind the session to a connection with an outer transaction."""
+        super().setUpClass()
+        app.config.from_object("project.config.TestingConfig")
+        with app.app_context():
+            if not BaseTestCase._schema_is_ready:
+                cls.recreate_schema()
+                BaseTestCase._schema_is_ready = True
+
+            # We register the cleanups right after we acquire the resources,
+            # so that they are released even if the rest of the setup fails.
+            # They run in reverse order.
+            cls._connection = db.engine.connect()
+            cls.addClassCleanup(cls._connection.close)
+            cls._transaction = cls._connection.begin()
+            cls.addClassCleanup(cls._transaction.rollback)
+            cls._session_options = dict(db.session.session_factory.kw)
+            cls.addClassCleanup(cls._restore_session)
+            db.session.remove()
+            # The binds are set per table by default, so we must empty them
+            # in order to use our connection for all of them.
+            db.session.configure(bind=cls._connection, binds={})
+
+            cls._start_savepoints()
+            cls.set_up_class_data()
+            cls._end_savepoints()
+            # Everything that we created so far should be kept for all
+            # of the tests.
+            cls._test_transaction.commit()
+
+    @classmethod
+    def _restore_session(cls):
+        """Unbind the session from our connection."""
+        db.session.remove()
+        if event.contains(db.session, "after_transaction_end", cls._restart_savepoint):
+            event.remove(db.session, "after_transaction_end", cls._restart_savepoint)
+        db.session.session_factory.kw = cls._session_options
+
+    @classmethod
+    def set_up_class_data(cls):
+        """Create data that can be reused for all the tests of the class."""
+        pass
+
+    @classmethod
+    def _start_savepoints(cls):
+        """Start the SAVEPOINTs to roll back to at the end."""
+        cls._test_transaction = cls._connection.begin_nested()
+        cls._nested_transaction = cls._connection.begin_nested()
+        event.listen(db.session, "after_transaction_end", cls._restart_savepoint)
+
+    @classmethod
+    def _restart_savepoint(cls, session, transaction):
+        """Start a new SAVEPOINT when the old one was released or rolled back."""
+        if not cls._nested_transaction.is_active:
+            cls._nested_transaction = cls._connection.begin_nested()
+
+    @classmethod
+    def _end_savepoints(cls):
+        """Close the session & stop restarting the SAVEPOINTs."""
+        db.session.remove()
+        event.remove(db.session, "after_transaction_end", cls._restart_savepoint)
+        if cls._nested_transaction.is_active:
+            cls._nested_transaction.commit()
+
+    def set_up_database(self):
+        """Start the SAVEPOINTs for the test."""
+        self._start_savepoints()
+        # Cleanups run even if the setUp of a subclass fails (in contrast
+        # to tearDown). Otherwise the SAVEPOINTs of the next test would
+        # be nested in the ones of this test.
+        self.addCleanup(self._roll_back_test)
+
+    def tear_down_database(self):
+        """Leave the rollback to the cleanup of set_up_database."""
+        pass
+
+    def _roll_back_test(self):
+        """Roll back all the changes of the test."""
+        self._end_savepoints()
+        self._test_transaction.rollback()
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2024
+# - Helmholtz Centre for Environmental Research GmbH - UFZ (UFZ, https://www.ufz.de)
+#
+# SPDX-License-Identifier: EUPL-1.2
+
+"""
+Hooks for running the tests with pytest.
+
+The tests themselves are unittest test cases, as they must run with
+`python manage.py test` as well.
+"""
+
+import os
+
+from project.api.models.base_model import db
+from project.config import TestingConfig
+from project.tests.base import BaseTestCase, ensure_test_database_exists
+from project.tests.base import app as test_app
+
+
+def pytest_configure(config):
+    """
+    Prepare the databases for the tests run with pytest-xdist.
+
+    The controller builds the schema once in the main test database.
+    The workers then clone it as template for their own databases. The
+    data of the tests is rolled back or dropped afterwards, so the
+    template stays clean.
+
+    We do this here (and not at the import of the test modules), so
+    that the databases are only created or dropped when we really run
+    the tests.
+    """
+    if TestingConfig.TESTING_FAST or not TestingConfig.SQLALCHEMY_DATABASE_URI:
+        return
+    if hasattr(config, "workerinput"):
+        template_url = None
+        if os.environ.get("TEST_DATABASE_TEMPLATE_READY"):
+            template_url = os.environ.get("DATABASE_TEST_URL")
+        if ensure_test_database_exists(
+            TestingConfig.SQLALCHEMY_DATABASE_URI, template_url
+        ):
+            BaseTestCase._schema_is_ready = True
+        return
+    if not config.getoption("numprocesses", None):
+        return
+    test_app.config.from_object("project.config.TestingConfig")
+    with test_app.app_context():
+        BaseTestCase.recreate_schema()
+        db.session.remove()
+        # Postgres can't use a database as template while
+        # there are still connections to it.
+        db.engine.dispose()
+    # The workers inherit the environment of the controller.
+    os.environ["TEST_DATABASE_TEMPLATE_READY"] = "1"
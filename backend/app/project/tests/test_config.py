@@ -5,10 +5,12 @@
 # SPDX-License-Identifier: EUPL-1.2
 
 import os
+from unittest.mock import patch
 
 from flask import current_app
 from flask_testing import TestCase
 
+from project.config import database_url_for_test_worker
 from project.tests.base import app
 
 
@@ -58,9 +60,13 @@ class TestTestingConfig(TestCase):
         self.assertTrue(app.config["SECRET_KEY"] == "top_secret")
         self.assertTrue(app.config["TESTING"])
         self.assertFalse(app.config["PRESERVE_CONTEXT_ON_EXCEPTION"])
-        self.assertTrue(
-            app.config["SQLALCHEMY_DATABASE_URI"] == os.environ.get("DATABASE_TEST_URL")
-        )
+        if app.config["TESTING_FAST"]:
+            expected_url = "sqlite:///:memory:"
+        else:
+            expected_url = database_url_for_test_worker(
+                os.environ.get("DATABASE_TEST_URL")
+            )
+        self.assertTrue(app.config["SQLALCHEMY_DATABASE_URI"] == expected_url)
 
 
 class TestProductionConfig(TestCase):
@@ -83,3 +89,34 @@ class TestProductionConfig(TestCase):
         """
         self.assertTrue(app.config["SECRET_KEY"] == "top_secret")
         self.assertFalse(app.config["TESTING"])
+
+
+class TestDatabaseUrlForTestWorker(TestCase):
+    """Test the database urls for the pytest-xdist workers."""
+
+    def create_app(self):
+        """Return the app with the testing config."""
+        app.config.from_object("project.config.TestingConfig")
+        return app
+
+    def test_without_worker(self):
+        """Ensure we keep the url if there is no worker."""
+        with patch.dict(os.environ, clear=False) as environ:
+            environ.pop("PYTEST_XDIST_WORKER", None)
+            result = database_url_for_test_worker(
+                "postgresql://user:pass@db:5432/db_test"
+            )
+        self.assertEqual(result, "postgresql://user:pass@db:5432/db_test")
+
+    def test_with_worker(self):
+        """Ensure the worker gets its own database - and keeps the password."""
+        with patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw1"}):
+            result = database_url_for_test_worker(
+                "postgresql://user:pass@db:5432/db_test"
+            )
+        self.assertEqual(result, "postgresql://user:pass@db:5432/db_test_gw1")
+
+    def test_without_url(self):
+        """Ensure we don't fail if there is no url."""
+        with patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw1"}):
+            self.assertIsNone(database_url_for_test_worker(None))
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2024
+# - Helmholtz Centre for Environmental Research GmbH - UFZ (UFZ, https://www.ufz.de)
+#
+# SPDX-License-Identifier: EUPL-1.2
+
+"""Test cases for the creation of the databases for the tests."""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from project.tests.base import ensure_test_database_exists
+
+template_url = "postgresql://user:pass@db:5432/db_test"
+worker_url = "postgresql://user:pass@db:5432/db_test_gw0"
+
+
+class TestEnsureTestDatabaseExists(TestCase):
+    """Test the ensure_test_database_exists function."""
+
+    def setUp(self):
+        """Mock the functions that would touch the database server."""
+        self.patches = {
+            name: patch(f"project.tests.base.{name}")
+            for name in ["create_database", "database_exists", "drop_database"]
+        }
+        self.mocks = {name: p.start() for name, p in self.patches.items()}
+
+    def tearDown(self):
+        """Stop the mocks."""
+        for p in self.patches.values():
+            p.stop()
+
+    def test_clone_from_template(self):
+        """Ensure we clone the worker database from the template."""
+        self.mocks["database_exists"].return_value = False
+
+        result = ensure_test_database_exists(worker_url, template_url)
+
+        self.assertTrue(result)
+        self.mocks["drop_database"].assert_not_called()
+        self.mocks["create_database"].assert_called_once_with(
+            worker_url, template="db_test"
+        )
+
+    def test_clone_replaces_old_database(self):
+        """Ensure we drop the database of an older run before cloning."""
+        self.mocks["database_exists"].return_value = True
+
+        result = ensure_test_database_exists(worker_url, template_url)
+
+        self.assertTrue(result)
+        self.mocks["drop_database"].assert_called_once_with(worker_url)
+        self.mocks["create_database"].assert_called_once_with(
+            worker_url, template="db_test"
+        )
+
+    def test_create_without_template(self):
+        """Ensure we create an empty database if there is no template."""
+        self.mocks["database_exists"].return_value = False
+
+        result = ensure_test_database_exists(worker_url)
+
+        self.assertFalse(result)
+        self.mocks["drop_database"].assert_not_called()
+        self.mocks["create_database"].assert_called_once_with(worker_url)
+
+    def test_keep_existing_database_without_template(self):
+        """Ensure we don't touch an existing database if there is no template."""
+        self.mocks["database_exists"].return_value = True
+
+        result = ensure_test_database_exists(worker_url)
+
+        self.assertFalse(result)
+        self.mocks["drop_database"].assert_not_called()
+        self.mocks["create_database"].assert_not_called()
+
+    def test_dont_clone_template_into_itself(self):
+        """Ensure we don't drop the template if it is the same database."""
+        self.mocks["database_exists"].return_value = True
+
+        result = ensure_test_database_exists(template_url, template_url)
+
+        self.assertFalse(result)
+        self.mocks["drop_database"].assert_not_called()
+        self.mocks["create_database"].assert_not_called()
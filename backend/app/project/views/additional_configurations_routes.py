@@ -12,8 +12,7 @@ methods, we need to add some extra endpoints
 in the style /<model_entities>/<id>/<verb> as post requests.
 """
 
-import json
-
+import orjson
 from flask import Blueprint, g
 
 from ..api.helpers.db import save_to_db
@@ -76,7 +75,7 @@ class ArchiveConfigurationView(BaseView):
 
             mqtt.publish(
                 "sms/patch-configuration",
-                json.dumps(ConfigurationSchema().dump(configuration)),
+                orjson.dumps(ConfigurationSchema().dump(configuration)),
             )
 
     def post(self):
@@ -122,7 +121,7 @@ class RestoreConfigurationView(BaseView):
             save_to_db(new_log_entry)
             mqtt.publish(
                 "sms/patch-configuration",
-                json.dumps(ConfigurationSchema().dump(configuration)),
+                orjson.dumps(ConfigurationSchema().dump(configuration)),
             )
 
     def post(self):
@@ -11,8 +11,7 @@ As we can't add a new verb like 'archive' in the http
 methods, we need to add some extra endpoints
 in the style /<model_entities>/<id>/<verb> as post requests.
 """
-import json
-
+import orjson
 from flask import Blueprint, g
 
 from ..api.helpers.db import save_to_db
@@ -67,7 +66,7 @@ class ArchiveDeviceView(BaseView):
             )
             save_to_db(new_log_entry)
 
-            mqtt.publish("sms/patch-device", json.dumps(DeviceSchema().dump(device)))
+            mqtt.publish("sms/patch-device", orjson.dumps(DeviceSchema().dump(device)))
 
     def post(self):
         """Run the post request."""
@@ -108,7 +107,7 @@ class RestoreDeviceView(BaseView):
                 description=device.update_description,
             )
             save_to_db(new_log_entry)
-            mqtt.publish("sms/patch-device", json.dumps(DeviceSchema().dump(device)))
+            mqtt.publish("sms/patch-device", orjson.dumps(DeviceSchema().dump(device)))
 
     def post(self):
         """Run the post request."""
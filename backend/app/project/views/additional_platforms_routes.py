@@ -12,8 +12,7 @@ methods, we need to add some extra endpoints
 in the style /<model_entities>/<id>/<verb> as post requests.
 """
 
-import json
-
+import orjson
 from flask import Blueprint, g
 
 from ..api.helpers.db import save_to_db
@@ -71,7 +70,7 @@ class ArchivePlatformView(BaseView):
             save_to_db(new_log_entry)
 
             mqtt.publish(
-                "sms/patch-platform", json.dumps(PlatformSchema().dump(platform))
+                "sms/patch-platform", orjson.dumps(PlatformSchema().dump(platform))
             )
 
     def post(self):
@@ -114,7 +113,7 @@ class RestorePlatformView(BaseView):
             )
             save_to_db(new_log_entry)
             mqtt.publish(
-                "sms/patch-platform", json.dumps(PlatformSchema().dump(platform))
+                "sms/patch-platform", orjson.dumps(PlatformSchema().dump(platform))
             )
 
     def post(self):
@@ -12,8 +12,7 @@ methods, we need to add some extra endpoints
 in the style /<model_entities>/<id>/<verb> as post requests.
 """
 
-import json
-
+import orjson
 from flask import Blueprint, g
 
 from ..api.helpers.db import save_to_db
@@ -60,7 +59,7 @@ class ArchiveSiteView(BaseView):
             )
             save_to_db(new_log_entry)
 
-            mqtt.publish("sms/patch-site", json.dumps(SiteSchema().dump(site)))
+            mqtt.publish("sms/patch-site", orjson.dumps(SiteSchema().dump(site)))
 
     def post(self):
         """Run the post request."""
@@ -98,7 +97,7 @@ class RestoreSiteView(BaseView):
                 description=site.update_description,
             )
             save_to_db(new_log_entry)
-            mqtt.publish("sms/patch-site", json.dumps(SiteSchema().dump(site)))
+            mqtt.publish("sms/patch-site", orjson.dumps(SiteSchema().dump(site)))
 
     def post(self):
         """Run the post request."""